@@ -1,16 +1,37 @@
 from sensor import setup_sensor, measure_distance, cleanup
 import time
 
+MEASUREMENT_PERIOD = 1  # Seconds between measurements
+
+def schedule_next_reading(deadline, now, period=MEASUREMENT_PERIOD):
+    """Returns the start of the slot after deadline, skipping slots already missed.
+
+    A reading that overruns its slot is followed by a full period instead of
+    a back-to-back catch-up reading.
+    """
+    next_deadline = deadline + period
+    if next_deadline <= now:
+        next_deadline = now + period
+    return next_deadline
+
 if __name__ == "__main__":
     try:
         # Setup the sensor
         setup_sensor()
 
+        deadline = time.monotonic()
         while True:
             # Measure and display the distance
             dist = measure_distance()
-            print(f"Measured Distance: {dist} cm")
-            time.sleep(1)  # Wait 1 second before the next measurement
+            if dist is None:
+                print("No echo received")
+            else:
+                print(f"Measured Distance: {dist} cm")
+
+            # Sleep until the next slot so the measurement time doesn't add drift
+            now = time.monotonic()
+            deadline = schedule_next_reading(deadline, now)
+            time.sleep(deadline - now)
 
     except KeyboardInterrupt:
         print("Measurement stopped by User")
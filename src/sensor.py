@@ -5,6 +5,14 @@ import time
 TRIG = 23
 ECHO = 24
 
+# Longest wait for a complete echo before a reading is abandoned, in seconds
+ECHO_TIMEOUT = 0.1
+
+# Settling parameters used by setup_sensor
+SETTLE_INTERVAL = 0.1  # Gap around each settle reading, in seconds
+SETTLE_TOLERANCE = 1  # Consecutive readings closer than this are stable, in cm
+SETTLE_MAX_READINGS = 5  # Give up on stability after this many readings
+
 def setup_sensor():
     """Initializes the GPIO pins for the ultrasonic sensor."""
     GPIO.setmode(GPIO.BCM)
@@ -13,23 +21,56 @@ def setup_sensor():
     GPIO.setup(ECHO, GPIO.IN)
     GPIO.output(TRIG, False)
     print("Waiting for sensor to settle")
-    time.sleep(2)  # Allow sensor to settle
+    _wait_for_stable_reading()
+
+def _wait_for_stable_reading():
+    """Takes readings until two consecutive ones agree or SETTLE_MAX_READINGS is reached."""
+    previous = None
+    for _ in range(SETTLE_MAX_READINGS):
+        time.sleep(SETTLE_INTERVAL)
+        current = measure_distance()
+
+        # A missed echo counts as not stable yet
+        if (current is not None and previous is not None
+                and abs(current - previous) < SETTLE_TOLERANCE):
+            break
+        previous = current
+
+    # Keep a full interval between the last settle reading and the caller's first one
+    time.sleep(SETTLE_INTERVAL)
+
+def measure_distance(timeout=ECHO_TIMEOUT):
+    """Measures the distance using the HC-SR04 sensor.
+
+    Returns None if no complete echo arrives within timeout seconds.
+    """
+    # Bind the lookups used in the busy-wait loops to locals for tighter timing
+    read_pin = GPIO.input
+    now = time.monotonic
+    deadline = now() + timeout
+
+    # Let the tail of an abandoned echo end so it isn't timed as this reading
+    while read_pin(ECHO) == 1:
+        if now() > deadline:
+            return None
 
-def measure_distance():
-    """Measures the distance using the HC-SR04 sensor."""
     # Triggering the sensor
     GPIO.output(TRIG, True)
     time.sleep(0.00001)  # Trigger pulse for 10µs
     GPIO.output(TRIG, False)
 
     # Measure the duration of the echo signal
-    pulse_start = time.time()
-    while GPIO.input(ECHO) == 0:
-        pulse_start = time.time()
+    pulse_start = now()
+    while read_pin(ECHO) == 0:
+        pulse_start = now()
+        if pulse_start > deadline:
+            return None
 
-    pulse_end = time.time()
-    while GPIO.input(ECHO) == 1:
-        pulse_end = time.time()
+    pulse_end = now()
+    while read_pin(ECHO) == 1:
+        pulse_end = now()
+        if pulse_end > deadline:
+            return None
 
     # Calculate the time difference
     pulse_duration = pulse_end - pulse_start
@@ -0,0 +1,14 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# RPi.GPIO only installs on a Raspberry Pi; tests swap in their own fake pins
+try:
+    import RPi.GPIO  # noqa: F401
+except ImportError:
+    rpi = types.ModuleType("RPi")
+    rpi.GPIO = types.ModuleType("RPi.GPIO")
+    sys.modules["RPi"] = rpi
+    sys.modules["RPi.GPIO"] = rpi.GPIO
@@ -0,0 +1,23 @@
+import pytest
+
+from main import MEASUREMENT_PERIOD, schedule_next_reading
+
+
+def test_next_slot_follows_on_time_reading():
+    assert schedule_next_reading(10.0, now=10.2, period=1.0) == pytest.approx(11.0)
+
+
+def test_overrun_waits_a_full_period():
+    assert schedule_next_reading(10.0, now=11.3, period=1.0) == pytest.approx(12.3)
+
+
+def test_multi_slot_overrun_skips_missed_slots():
+    assert schedule_next_reading(10.0, now=13.5, period=1.0) == pytest.approx(14.5)
+
+
+def test_reading_ending_on_the_next_slot_is_an_overrun():
+    assert schedule_next_reading(10.0, now=11.0, period=1.0) == pytest.approx(12.0)
+
+
+def test_uses_measurement_period_by_default():
+    assert schedule_next_reading(0.0, now=0.2) == pytest.approx(MEASUREMENT_PERIOD)
@@ -0,0 +1,157 @@
+import types
+
+import pytest
+
+import sensor
+
+POLL_TIME = 1e-6  # Fake time each ECHO read takes, in seconds
+
+
+def echo_width(distance):
+    """Returns the echo pulse width the HC-SR04 produces for distance cm."""
+    return distance / 17150
+
+
+class FakeHCSR04:
+    """Simulates the sensor's pins on a fake clock.
+
+    Each trigger consumes the next (delay, width) entry of echoes; None means
+    the trigger gets no echo at all.
+    """
+
+    def __init__(self, echoes):
+        self.echoes = list(echoes)
+        self.high = []  # (start, end) intervals while ECHO is high
+        self.clock = 0.0
+        self.trig = False
+        self.triggers = 0
+
+    def now(self):
+        return self.clock
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def output(self, pin, value):
+        if pin == sensor.TRIG:
+            if self.trig and not value:
+                self.triggers += 1
+                echo = self.echoes.pop(0)
+                if echo is not None:
+                    delay, width = echo
+                    start = self.clock + delay
+                    self.high.append((start, start + width))
+            self.trig = value
+
+    def input(self, pin):
+        assert pin == sensor.ECHO
+        self.clock += POLL_TIME
+        return int(any(start <= self.clock < end for start, end in self.high))
+
+
+@pytest.fixture
+def hcsr04(monkeypatch):
+    def install(echoes):
+        fake = FakeHCSR04(echoes)
+        monkeypatch.setattr(sensor.time, "monotonic", fake.now)
+        monkeypatch.setattr(sensor.time, "sleep", fake.sleep)
+        monkeypatch.setattr(sensor, "GPIO", types.SimpleNamespace(input=fake.input, output=fake.output))
+        return fake
+    return install
+
+
+def test_measures_distance_from_echo_width(hcsr04):
+    hcsr04([(0.0005, echo_width(100))])
+    assert sensor.measure_distance() == pytest.approx(100, abs=0.1)
+
+
+def test_returns_none_without_echo(hcsr04):
+    fake = hcsr04([None])
+    assert sensor.measure_distance() is None
+    assert fake.clock <= sensor.ECHO_TIMEOUT + 2 * POLL_TIME
+
+
+def test_returns_none_when_echo_stuck_high(hcsr04):
+    fake = hcsr04([(0.0005, 10.0)])
+    assert sensor.measure_distance() is None
+    assert fake.clock <= sensor.ECHO_TIMEOUT + 2 * POLL_TIME
+
+
+def test_honours_custom_timeout(hcsr04):
+    fake = hcsr04([None])
+    assert sensor.measure_distance(timeout=0.02) is None
+    assert 0.02 <= fake.clock <= 0.02 + 2 * POLL_TIME
+
+
+def test_waits_out_stale_echo_before_triggering(hcsr04):
+    hcsr04([(0.0005, 0.15), (0.0005, echo_width(100))])
+    assert sensor.measure_distance() is None
+    assert sensor.measure_distance() == pytest.approx(100, abs=0.1)
+
+
+def test_gives_up_without_triggering_while_stale_echo_persists(hcsr04):
+    fake = hcsr04([(0.0005, 10.0), (0.0005, echo_width(100))])
+    assert sensor.measure_distance() is None
+    assert sensor.measure_distance() is None
+    assert fake.triggers == 1
+
+
+class FakeSettle:
+    """Replays readings in place of measure_distance and records sleeps."""
+
+    def __init__(self, readings):
+        self.readings = list(readings)
+        self.events = []
+
+    def sleep(self, seconds):
+        self.events.append(("sleep", seconds))
+
+    def measure_distance(self):
+        self.events.append(("measure", None))
+        return self.readings.pop(0)
+
+    @property
+    def reading_count(self):
+        return sum(1 for kind, _ in self.events if kind == "measure")
+
+
+@pytest.fixture
+def settle(monkeypatch):
+    def install(readings):
+        fake = FakeSettle(readings)
+        monkeypatch.setattr(sensor.time, "sleep", fake.sleep)
+        monkeypatch.setattr(sensor, "measure_distance", fake.measure_distance)
+        return fake
+    return install
+
+
+def test_settle_stops_once_readings_agree(settle):
+    fake = settle([50.0, 50.4, 80.0])
+    sensor._wait_for_stable_reading()
+    assert fake.reading_count == 2
+
+
+def test_settle_discards_outlier_first_reading(settle):
+    fake = settle([3.0, 50.0, 50.2])
+    sensor._wait_for_stable_reading()
+    assert fake.reading_count == 3
+
+
+def test_settle_treats_missed_echo_as_unstable(settle):
+    fake = settle([None, 50.0, 50.2])
+    sensor._wait_for_stable_reading()
+    assert fake.reading_count == 3
+
+
+def test_settle_gives_up_after_max_readings(settle):
+    fake = settle([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+    sensor._wait_for_stable_reading()
+    assert fake.reading_count == sensor.SETTLE_MAX_READINGS
+
+
+def test_settle_spaces_every_reading_including_the_last(settle):
+    fake = settle([50.0, 50.0])
+    sensor._wait_for_stable_reading()
+    gap = ("sleep", sensor.SETTLE_INTERVAL)
+    reading = ("measure", None)
+    assert fake.events == [gap, reading, gap, reading, gap]